@@ -120,46 +120,46 @@ class FillIsLatestIssueTests(unittest.TestCase):
     result = list(self.cur)
     expected = [
         (1, 'src', 'sig', 'day', 'state', 20200228, 'ca',
-          123, 2.0, 5.0, 5.0, 5, None, 20200228, 0, bytearray(b'0'), bytearray(b'0'),
+          123, 2.0, 5.0, 5.0, 5, None, 20200228, 0, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (2, 'src', 'sig', 'day', 'state', 20200228, 'ca',
-          123, 2.0, 0.0, 0.0, 0, None, 20200229, 1, bytearray(b'1'), bytearray(b'0'),
+          123, 2.0, 0.0, 0.0, 0, None, 20200229, 1, 1, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (3, 'src', 'sig', 'day', 'state', 20200229, 'ca',
-          123, 6.0, 0.0, 0.0, 0, None, 20200301, 1, bytearray(b'1'), bytearray(b'0'),
+          123, 6.0, 0.0, 0.0, 0, None, 20200301, 1, 1, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (4, 'src', 'sig', 'day', 'state', 20200229, 'ca',
-          123, 6.0, 9.0, 9.0, 9, None, 20200229, 0, bytearray(b'0'), bytearray(b'0'),
+          123, 6.0, 9.0, 9.0, 9, None, 20200229, 0, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (5, 'src', 'sig', 'day', 'state', 20200301, 'ca',
-          123, 5.0, 0.0, 0.0, 0, None, 20200303, 2, bytearray(b'1'), bytearray(b'0'),
+          123, 5.0, 0.0, 0.0, 0, None, 20200303, 2, 1, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (6, 'src', 'sig', 'day', 'state', 20200301, 'ca',
-          123, 5.0, 5.0, 5.0, 5, None, 20200302, 1, bytearray(b'0'), bytearray(b'0'),
+          123, 5.0, 5.0, 5.0, 5, None, 20200302, 1, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (7, 'src', 'sig', 'day', 'state', 20200301, 'ca',
-          123, 5.0, 9.0, 8.0, 7, None, 20200301, 0, bytearray(b'0'), bytearray(b'0'),
+          123, 5.0, 9.0, 8.0, 7, None, 20200301, 0, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (8, 'src', 'sig', 'day', 'state', 20200228, 'ny',
-          123, 2.0, 5.0, 5.0, 5, None, 20200228, 0, bytearray(b'0'), bytearray(b'0'),
+          123, 2.0, 5.0, 5.0, 5, None, 20200228, 0, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (9, 'src', 'sig', 'day', 'state', 20200228, 'ny',
-          123, 2.0, 0.0, 0.0, 0, None, 20200229, 1, bytearray(b'1'), bytearray(b'0'),
+          123, 2.0, 0.0, 0.0, 0, None, 20200229, 1, 1, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (10, 'src', 'sig', 'day', 'state', 20200229, 'ny',
-          123, 6.0, 0.0, 0.0, 0, None, 20200301, 1, bytearray(b'1'), bytearray(b'0'),
+          123, 6.0, 0.0, 0.0, 0, None, 20200301, 1, 1, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (11, 'src', 'sig', 'day', 'state', 20200229, 'ny',
-          123, 6.0, 9.0, 9.0, 9, None, 20200229, 0, bytearray(b'0'), bytearray(b'0'),
+          123, 6.0, 9.0, 9.0, 9, None, 20200229, 0, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (12, 'src', 'sig', 'day', 'state', 20200301, 'ny',
-          123, 5.0, 0.0, 0.0, 0, None, 20200303, 2, bytearray(b'1'), bytearray(b'0'),
+          123, 5.0, 0.0, 0.0, 0, None, 20200303, 2, 1, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (13, 'src', 'sig', 'day', 'state', 20200301, 'ny',
-          123, 5.0, 5.0, 5.0, 5, None, 20200302, 1, bytearray(b'0'), bytearray(b'0'),
+          123, 5.0, 5.0, 5.0, 5, None, 20200302, 1, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING),
         (14, 'src', 'sig', 'day', 'state', 20200301, 'ny',
-          123, 5.0, 9.0, 8.0, 7, None, 20200301, 0, bytearray(b'0'), bytearray(b'0'),
+          123, 5.0, 9.0, 8.0, 7, None, 20200301, 0, 0, bytearray(b'0'),
           Nans.NOT_MISSING, Nans.NOT_MISSING, Nans.NOT_MISSING)
     ]
 
@@ -167,7 +167,7 @@ class FillIsLatestIssueTests(unittest.TestCase):
       # revert ny is_latest values
       for i in range(7, 14):
         x = list(expected[i])
-        x[-5] = bytearray(b'1')
+        x[-5] = 1
         expected[i] = tuple(x)
 
     self.assertEqual(result, expected)
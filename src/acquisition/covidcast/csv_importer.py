@@ -1,7 +1,7 @@
 """Collects and reads covidcast data from a set of local CSV files."""
 
 # standard library
-from datetime import date
+from datetime import date, timedelta
 import glob
 import math
 import os
@@ -16,28 +16,63 @@ from delphi_utils import Nans
 from delphi.utils.epiweek import delta_epiweeks
 from delphi.epidata.acquisition.covidcast.logger import get_structured_logger
 
+
+def _days_by_value(min_year, max_year):
+  """Map each YYYYMMDD value within the given years to its `datetime.date`."""
+
+  first, last = date(min_year, 1, 1), date(max_year, 12, 31)
+  days = (first + timedelta(days=i) for i in range((last - first).days + 1))
+  return {day.year * 10000 + day.month * 100 + day.day: day for day in days}
+
+
+def _float_or_nan(value):
+  """Parse `value` with `float`, but return NaN rather than raise `ValueError`."""
+
+  try:
+    return float(value)
+  except ValueError:
+    return math.nan
+
+
 class CsvImporter:
   """Finds and parses covidcast CSV files."""
 
-  # .../source/yyyymmdd_geo_signal.csv
-  PATTERN_DAILY = re.compile(r'^.*/([^/]*)/(\d{8})_(\w+?)_(\w+)\.csv$')
-
-  # .../source/weekly_yyyyww_geo_signal.csv
-  PATTERN_WEEKLY = re.compile(r'^.*/([^/]*)/weekly_(\d{6})_(\w+?)_(\w+)\.csv$')
+  # .../source/yyyymmdd_geo_signal.csv (daily) or
+  # .../source/weekly_yyyyww_geo_signal.csv (weekly)
+  PATTERN_CSV = re.compile(r'^.*/(?P<source>[^/]*)/(?:(?P<day>\d{8})|weekly_(?P<week>\d{6}))_(?P<geo_type>\w+?)_(?P<signal>\w+)\.csv$')
 
   # .../issue_yyyymmdd
   PATTERN_ISSUE_DIR = re.compile(r'^.*/([^/]*)/issue_(\d{8})$')
 
   # set of allowed resolutions (aka "geo_type")
-  GEOGRAPHIC_RESOLUTIONS = {'county', 'hrr', 'msa', 'dma', 'state', 'hhs', 'nation'}
+  GEOGRAPHIC_RESOLUTIONS = frozenset({'county', 'hrr', 'msa', 'dma', 'state', 'hhs', 'nation'})
+
+  # sanity checks for geo_id with respect to geo_type: (length, min, max) for
+  # geo_ids compared as (lowercase) strings and (min, max) for geo_ids compared
+  # as integers
+  GEO_ID_STRING_BOUNDS = {
+    'county': (5, '01000', '80000'),
+    'state': (2, 'aa', 'zz'),
+    'nation': (2, 'aa', 'zz'),
+  }
+  GEO_ID_INTEGER_BOUNDS = {
+    'hrr': (1, 500),
+    'msa': (10000, 99999),
+    'dma': (450, 950),
+    'hhs': (1, 10),
+  }
 
   # set of required CSV columns
-  REQUIRED_COLUMNS = {'geo_id', 'val', 'se', 'sample_size'}
+  REQUIRED_COLUMNS = frozenset({'geo_id', 'val', 'se', 'sample_size'})
 
   # reasonable time bounds for sanity checking time values
   MIN_YEAR = 2019
   MAX_YEAR = 2030
 
+  # every sane time value, precomputed so that checking one is a single lookup
+  SANE_DAYS = _days_by_value(MIN_YEAR, MAX_YEAR)
+  SANE_WEEKS = frozenset(year * 100 + week for year in range(MIN_YEAR, MAX_YEAR + 1) for week in range(1, 54))
+
   DTYPES = {
     "geo_id": str,
     "val": float,
@@ -64,19 +99,11 @@ class CsvImporter:
 
   @staticmethod
   def is_sane_day(value):
-    """Return whether `value` is a sane (maybe not valid) YYYYMMDD date.
+    """Return whether `value` is a sane and valid YYYYMMDD date.
 
     Truthy return is is a datetime.date object representing `value`."""
 
-    year, month, day = value // 10000, (value % 10000) // 100, value % 100
-
-    nearby_year = CsvImporter.MIN_YEAR <= year <= CsvImporter.MAX_YEAR
-    valid_month = 1 <= month <= 12
-    sensible_day = 1 <= day <= 31
-
-    if not (nearby_year and valid_month and sensible_day):
-      return False
-    return date(year=year,month=month,day=day)
+    return CsvImporter.SANE_DAYS.get(value, False)
 
   @staticmethod
   def is_sane_week(value):
@@ -84,14 +111,7 @@ class CsvImporter:
 
     Truthy return is `value`."""
 
-    year, week = value // 100, value % 100
-
-    nearby_year = CsvImporter.MIN_YEAR <= year <= CsvImporter.MAX_YEAR
-    sensible_week = 1 <= week <= 53
-
-    if not (nearby_year and sensible_week):
-      return False
-    return value
+    return value if value in CsvImporter.SANE_WEEKS else False
 
   @staticmethod
   def find_issue_specific_csv_files(scan_dir, glob=glob):
@@ -108,16 +128,21 @@ class CsvImporter:
           logger.warning(event='invalid issue directory day', detail=issue_date_value, file=path)
 
   @staticmethod
-  def find_csv_files(scan_dir, issue=(date.today(), epi.Week.fromdate(date.today())), glob=glob):
+  def find_csv_files(scan_dir, issue=None, glob=glob):
     """Recursively search for and yield covidcast-format CSV files.
 
     scan_dir: the directory to scan (recursively)
+    issue: a tuple of (issue day, issue epiweek); defaults to today, resolved
+      once per scan
 
     The return value is a tuple of (path, details), where, if the path was
     valid, details is a tuple of (source, signal, time_type, geo_type,
     time_value, issue, lag) (otherwise None).
     """
     logger = get_structured_logger('find_csv_files')
+    if issue is None:
+      today = date.today()
+      issue = (today, epi.Week.fromdate(today))
     issue_day,issue_epiweek=issue
     issue_day_value=int(issue_day.strftime("%Y%m%d"))
     issue_epiweek_value=int(str(issue_epiweek))
@@ -126,22 +151,21 @@ class CsvImporter:
 
     for path in sorted(glob.glob(os.path.join(scan_dir, '*', '*'))):
 
-      if not path.lower().endswith('.csv'):
+      lower_path = path.lower()
+      if not lower_path.endswith('.csv'):
         # safe to ignore this file
         continue
       # match a daily or weekly naming pattern
-      daily_match = CsvImporter.PATTERN_DAILY.match(path.lower())
-      weekly_match = CsvImporter.PATTERN_WEEKLY.match(path.lower())
-      if not daily_match and not weekly_match:
+      match = CsvImporter.PATTERN_CSV.match(lower_path)
+      if not match:
         logger.warning(event='invalid csv path/filename', detail=path, file=path)
         yield (path, None)
         continue
 
       # extract and validate time resolution
-      if daily_match:
+      if match.group('day'):
         time_type = 'day'
-        time_value = int(daily_match.group(2))
-        match = daily_match
+        time_value = int(match.group('day'))
         time_value_day = CsvImporter.is_sane_day(time_value)
         if not time_value_day:
           logger.warning(event='invalid filename day', detail=time_value, file=path)
@@ -151,8 +175,7 @@ class CsvImporter:
         lag_value=(issue_day-time_value_day).days
       else:
         time_type = 'week'
-        time_value = int(weekly_match.group(2))
-        match = weekly_match
+        time_value = int(match.group('week'))
         time_value_week=CsvImporter.is_sane_week(time_value)
         if not time_value_week:
           logger.warning(event='invalid filename week', detail=time_value, file=path)
@@ -162,15 +185,15 @@ class CsvImporter:
         lag_value=delta_epiweeks(time_value_week, issue_epiweek_value)
 
       # # extract and validate geographic resolution
-      geo_type = match.group(3).lower()
+      geo_type = match.group('geo_type')
       if geo_type not in CsvImporter.GEOGRAPHIC_RESOLUTIONS:
         logger.warning(event='invalid geo_type', detail=geo_type, file=path)
         yield (path, None)
         continue
 
-      # extract additional values, lowercased for consistency
-      source = match.group(1).lower()
-      signal = match.group(4).lower()
+      # extract additional values, lowercased (with the path) for consistency
+      source = match.group('source')
+      signal = match.group('signal')
       if len(signal) > 64:
         logger.warning(event='invalid signal name (64 char limit)',detail=signal, file=path)
         yield (path, None)
@@ -182,7 +205,7 @@ class CsvImporter:
   def is_header_valid(columns):
     """Return whether the given pandas columns contains the required fields."""
 
-    return set(columns) >= CsvImporter.REQUIRED_COLUMNS
+    return CsvImporter.REQUIRED_COLUMNS.issubset(columns)
 
   @staticmethod
   def floaty_int(value):
@@ -200,9 +223,17 @@ class CsvImporter:
   @staticmethod
   def maybe_apply(func, quantity):
     """Apply the given function to the given quantity if not null-ish."""
-    if str(quantity).lower() in ('inf', '-inf'):
+    if isinstance(quantity, float):
+      # already parsed by pandas, so skip formatting it back into a string
+      if math.isinf(quantity):
+        raise ValueError("Quantity given was an inf.")
+      elif math.isnan(quantity):
+        return None
+      return func(quantity)
+    text = str(quantity).lower()
+    if text in ('inf', '-inf'):
       raise ValueError("Quantity given was an inf.")
-    elif str(quantity).lower() in ('', 'na', 'nan', 'none'):
+    elif text in ('', 'na', 'nan', 'none'):
       return None
     else:
       return func(quantity)
@@ -252,6 +283,46 @@ class CsvImporter:
 
     return missing_entry
 
+  @staticmethod
+  def normalize_geo_ids(geo_ids, geo_type):
+    """Sanity check and normalize a whole pandas column of geo_ids at once.
+
+    Returns a pandas series of the geo_ids, lowercased and, for geo types with
+    numeric ids, formatted as ints. Each geo_id which fails sanity checks is
+    replaced by `None`, as are all of them if `geo_type` is unknown.
+
+    geo_ids: the pandas series of geo_ids to check
+    geo_type: the geographic resolution of the file
+    """
+
+    geo_values = pandas.Series([None] * len(geo_ids), index=geo_ids.index, dtype=object)
+    try:
+      # use consistent capitalization (e.g. for states); geo_ids which aren't
+      # strings (e.g. missing ones) become NaN here, and then fail the checks
+      geo_ids = geo_ids.str.lower()
+    except AttributeError:
+      # not a column of strings at all
+      return geo_values
+
+    if geo_type in CsvImporter.GEO_ID_STRING_BOUNDS:
+      length, min_value, max_value = CsvImporter.GEO_ID_STRING_BOUNDS[geo_type]
+      filled = geo_ids.fillna('')
+      valid = (filled.str.len() == length) & (filled >= min_value) & (filled <= max_value)
+      geo_values[valid] = geo_ids[valid]
+
+    elif geo_type in CsvImporter.GEO_ID_INTEGER_BOUNDS:
+      min_value, max_value = CsvImporter.GEO_ID_INTEGER_BOUNDS[geo_type]
+      # these particular ids are prone to be written as ints -- and floats
+      numbers = pandas.to_numeric(geo_ids, errors='coerce').astype(float)
+      # whatever pandas can't parse gets another chance with `float`, like `floaty_int`
+      unparsed = numbers.isna() & geo_ids.notna()
+      if unparsed.any():
+        numbers[unparsed] = geo_ids[unparsed].map(_float_or_nan)
+      valid = (numbers % 1 == 0) & numbers.between(min_value, max_value)
+      geo_values[valid] = numbers[valid].astype(int).astype(str)
+
+    return geo_values
+
   @staticmethod
   def extract_and_check_row(row, geo_type, filepath=None):
     """Extract and return `RowValues` from a CSV row, with sanity checks.
@@ -262,54 +333,24 @@ class CsvImporter:
     geo_type: the geographic resolution of the file
     """
 
-    # use consistent capitalization (e.g. for states)
-    try:
-      geo_id = row.geo_id.lower()
-    except AttributeError as e:
-      # geo_id was `None`
-      return (None, 'geo_id')
+    geo_value = CsvImporter.normalize_geo_ids(pandas.Series([row.geo_id], dtype=object), geo_type)[0]
+    return CsvImporter.check_row(row, geo_type, geo_value, filepath)
 
-    if geo_type in ('hrr', 'msa', 'dma', 'hhs'):
-      # these particular ids are prone to be written as ints -- and floats
-      try:
-        geo_id = str(CsvImporter.floaty_int(geo_id))
-      except ValueError:
-        # expected a number, but got a string
-        return (None, 'geo_id')
-
-    # sanity check geo_id with respect to geo_type
-    if geo_type == 'county':
-      if len(geo_id) != 5 or not '01000' <= geo_id <= '80000':
-        return (None, 'geo_id')
-
-    elif geo_type == 'hrr':
-      if not 1 <= int(geo_id) <= 500:
-        return (None, 'geo_id')
-
-    elif geo_type == 'msa':
-      if len(geo_id) != 5 or not '10000' <= geo_id <= '99999':
-        return (None, 'geo_id')
-
-    elif geo_type == 'dma':
-      if not 450 <= int(geo_id) <= 950:
-        return (None, 'geo_id')
-
-    elif geo_type == 'state':
-      # note that geo_id is lowercase
-      if len(geo_id) != 2 or not 'aa' <= geo_id <= 'zz':
-        return (None, 'geo_id')
-
-    elif geo_type == 'hhs':
-      if not 1 <= int(geo_id) <= 10:
-        return (None, 'geo_id')
-
-    elif geo_type == 'nation':
-      # geo_id is lowercase
-      if len(geo_id) != 2 or not 'aa' <= geo_id <= 'zz':
-        return (None, 'geo_id')
+  @staticmethod
+  def check_row(row, geo_type, geo_value, filepath=None):
+    """Sanity check the values of a CSV row whose geo_id is already normalized.
 
-    else:
+    Returns the same as `extract_and_check_row`.
+
+    row: the pandas table row to extract
+    geo_type: the geographic resolution of the file
+    geo_value: the row's geo_id as returned by `normalize_geo_ids`
+    """
+
+    if geo_type not in CsvImporter.GEOGRAPHIC_RESOLUTIONS:
       return (None, 'geo_type')
+    if geo_value is None:
+      return (None, 'geo_id')
 
     # Validate row values
     value = CsvImporter.validate_quantity(row, "value")
@@ -332,7 +373,7 @@ class CsvImporter:
 
     # return extracted and validated row values
     row_values = CsvImporter.RowValues(
-      geo_id, value, stderr, sample_size,
+      geo_value, value, stderr, sample_size,
       missing_value, missing_stderr, missing_sample_size
     )
     return (row_values, None)
@@ -362,8 +403,11 @@ class CsvImporter:
 
     table.rename(columns={"val": "value", "se": "stderr", "missing_val": "missing_value", "missing_se": "missing_stderr"}, inplace=True)
 
-    for row in table.itertuples(index=False):
-      row_values, error = CsvImporter.extract_and_check_row(row, geo_type, filepath)
+    # check the geo_ids of the whole file at once, rather than row by row
+    geo_values = CsvImporter.normalize_geo_ids(table['geo_id'], geo_type)
+
+    for row, geo_value in zip(table.itertuples(index=False), geo_values):
+      row_values, error = CsvImporter.check_row(row, geo_type, geo_value, filepath)
       if error:
         logger.warning(event = 'invalid value for row', detail=(str(row), error), file=filepath)
         yield None
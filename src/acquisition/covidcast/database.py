@@ -132,7 +132,7 @@ class Database:
         `direction` int(11),
         `issue` int(11) NOT NULL,
         `lag` int(11) NOT NULL,
-        `is_latest_issue` BINARY(1) NOT NULL,
+        `is_latest_issue` TINYINT(1) UNSIGNED NOT NULL DEFAULT 0,
         `is_wip` BINARY(1) NOT NULL,
         `missing_value` int(1) DEFAULT 0,
         `missing_stderr` int(1) DEFAULT 0,
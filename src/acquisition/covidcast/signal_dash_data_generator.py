@@ -161,7 +161,7 @@ class Database:
             '''
         self._cursor.execute(select_statement)
         enabled_signals = []
-        for result in self._cursor.fetchall():
+        for result in self._cursor:
             enabled_signals.append(
                 DashboardSignal(
                     db_id=result[0],
@@ -27,7 +27,7 @@ Data is public.
 | direction                    | int(11)     | YES  |     | NULL    | deprecated     |
 | issue                        | int(11)     | NO   |     | NULL    |                |
 | lag                          | int(11)     | NO   |     | NULL    |                |
-| is_latest_issue              | binary(1)   | NO   |     | NULL    |                |
+| is_latest_issue              | tinyint(1)  | NO   |     | 0       |                |
 | is_wip                       | binary(1)   | YES  |     | NULL    |                |
 | missing_value                | int(1)      | YES  |     | NULL    |                |
 | missing_stderr               | int(1)      | YES  |     | NULL    |                |
@@ -99,7 +99,7 @@ CREATE TABLE `covidcast` (
   `direction` int(11),
   `issue` int(11) NOT NULL,
   `lag` int(11) NOT NULL,
-  `is_latest_issue` binary(1) NOT NULL,
+  `is_latest_issue` tinyint(1) unsigned NOT NULL DEFAULT 0,
   `is_wip` binary(1) DEFAULT NULL,
   `missing_value` int(1) DEFAULT 0,
   `missing_stderr` int(1) DEFAULT 0,
@@ -109,7 +109,9 @@ CREATE TABLE `covidcast` (
   UNIQUE KEY (`source`, `signal`, `time_type`, `geo_type`, `time_value`, `geo_value`, `issue`),
   -- for fast lookup of a time-series for a given location
   KEY `by_issue` (`source`, `signal`, `time_type`, `geo_type`, `geo_value`, `time_value`, `issue`),
-  KEY `by_lag` (`source`, `signal`, `time_type`, `geo_type`, `geo_value`, `time_value`, `lag`)
+  KEY `by_lag` (`source`, `signal`, `time_type`, `geo_type`, `geo_value`, `time_value`, `lag`),
+  -- for fast lookup of the latest issue of a time-series for a given location
+  KEY `by_latest` (`source`, `signal`, `time_type`, `geo_type`, `geo_value`, `time_value`, `is_latest_issue`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
 
 -- important index for computing metadata efficiently (dont forget to use a hint in your query!)
@@ -0,0 +1,8 @@
+-- a single ALTER, so that the table is rebuilt once for both changes
+ALTER TABLE `covidcast`
+  -- store `is_latest_issue` as an integer, so "latest issue" queries compare it
+  -- as a number and can look it up through the `by_latest` index
+  MODIFY `is_latest_issue` tinyint(1) unsigned NOT NULL DEFAULT 0,
+  -- lets "latest issue" queries filter on `is_latest_issue` from the index,
+  -- instead of reading every issue of a time-series from the table
+  ADD KEY `by_latest` (`source`, `signal`, `time_type`, `geo_type`, `geo_value`, `time_value`, `is_latest_issue`);
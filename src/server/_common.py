@@ -1,16 +1,34 @@
-from typing import cast
+import time
+from typing import Tuple, cast
 
 from flask import Flask, g, request
 from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.local import LocalProxy
 
-from ._config import SECRET
+from ._config import SECRET, URL_PREFIX
 from ._db import engine
 from ._exceptions import DatabaseErrorException
 
 app = Flask("EpiData", static_url_path="")
 app.config["SECRET"] = SECRET
 
+# minimum number of seconds between logged tracebacks of database connection errors
+_DB_ERROR_TRACEBACK_INTERVAL = 60.0
+_last_db_error_traceback = float("-inf")
+
+
+def _db_skip_prefixes(url_prefix: str) -> Tuple[str, ...]:
+    """
+    paths which are served without touching the database
+    """
+    # the default prefix is "/", but request.path has its slashes merged, so never starts with "//"
+    base = url_prefix.rstrip("/")
+    return (f"{base}/lib", f"{base}/version", f"{base}/index.html")
+
+
+_DB_SKIP_PREFIXES = _db_skip_prefixes(URL_PREFIX)
+
 
 def _get_db() -> Connection:
     if "db" not in g:
@@ -27,13 +45,22 @@ db: Connection = cast(Connection, LocalProxy(_get_db))
 
 @app.before_request
 def connect_db():
-    if request.path.startswith('/lib'):
+    global _last_db_error_traceback
+    if request.path.startswith(_DB_SKIP_PREFIXES):
+        return
+    # cors preflight requests never reach an endpoint, so they don't need a connection either
+    if request.method == "OPTIONS":
         return
     # try to get the db
     try:
         _get_db()
-    except:
-        app.logger.error('database connection error', exc_info=True)
+    except SQLAlchemyError as e:
+        # an outage fails every request, so only include the traceback every now and then
+        now = time.monotonic()
+        with_traceback = now - _last_db_error_traceback >= _DB_ERROR_TRACEBACK_INTERVAL
+        if with_traceback:
+            _last_db_error_traceback = now
+        app.logger.error("database connection error: %s", e, exc_info=with_traceback)
         raise DatabaseErrorException()
 
 
@@ -50,7 +77,7 @@ def is_compatibility_mode() -> bool:
     """
     checks whether this request is in compatibility mode
     """
-    return 'compatibility' in g and g.compatibility
+    return g.get("compatibility", False)
 
 
 def set_compatibility_mode():
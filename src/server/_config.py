@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 from flask import Flask
 import json
@@ -28,22 +29,26 @@ AUTH = {
 
 # begin sensor query authentication configuration
 #   A multimap of sensor names to the "granular" auth tokens that can be used to access them; excludes the "global" sensor auth key that works for all sensors:
-GRANULAR_SENSOR_AUTH_TOKENS = {
-    "twtr": os.environ.get("SECRET_SENSOR_TWTR", "").split(","),
-    "gft": os.environ.get("SECRET_SENSOR_GFT", "").split(","),
-    "ght": os.environ.get("SECRET_SENSOR_GHT", "").split(","),
-    "ghtj": os.environ.get("SECRET_SENSOR_GHTJ", "").split(","),
-    "cdc": os.environ.get("SECRET_SENSOR_CDC", "").split(","),
-    "quid": os.environ.get("SECRET_SENSOR_QUID", "").split(","),
-    "wiki": os.environ.get("SECRET_SENSOR_WIKI", "").split(","),
-}
+GRANULAR_SENSOR_AUTH_TOKENS = MappingProxyType(
+    {
+        "twtr": tuple(os.environ.get("SECRET_SENSOR_TWTR", "").split(",")),
+        "gft": tuple(os.environ.get("SECRET_SENSOR_GFT", "").split(",")),
+        "ght": tuple(os.environ.get("SECRET_SENSOR_GHT", "").split(",")),
+        "ghtj": tuple(os.environ.get("SECRET_SENSOR_GHTJ", "").split(",")),
+        "cdc": tuple(os.environ.get("SECRET_SENSOR_CDC", "").split(",")),
+        "quid": tuple(os.environ.get("SECRET_SENSOR_QUID", "").split(",")),
+        "wiki": tuple(os.environ.get("SECRET_SENSOR_WIKI", "").split(",")),
+    }
+)
 
 #   A set of sensors that do not require an auth key to access:
-OPEN_SENSORS = [
-    "sar3",
-    "epic",
-    "arch",
-]
+OPEN_SENSORS = frozenset(
+    {
+        "sar3",
+        "epic",
+        "arch",
+    }
+)
 
 REGION_TO_STATE = {
     "hhs1": ["VT", "CT", "ME", "MA", "NH", "RI"],
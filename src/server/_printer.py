@@ -34,7 +34,9 @@ class APrinter:
     def __init__(self):
         self.count: int = 0
         self.result: int = -1
-        self._max_results: int = MAX_COMPATIBILITY_RESULTS if is_compatibility_mode() else MAX_RESULTS
+        # read once, since it is fixed for the request and checked while printing rows
+        self._compatibility: bool = is_compatibility_mode()
+        self._max_results: int = MAX_COMPATIBILITY_RESULTS if self._compatibility else MAX_RESULTS
 
     def make_response(self, gen):
         return Response(
@@ -113,12 +115,12 @@ class ClassicPrinter(APrinter):
     """
 
     def _begin(self):
-        if is_compatibility_mode():
+        if self._compatibility:
             return "{ "
         return '{ "epidata": ['
 
     def _format_row(self, first: bool, row: Dict):
-        if first and is_compatibility_mode():
+        if first and self._compatibility:
             sep = b'"epidata": ['
         else:
             sep = b"," if not first else b""
@@ -127,7 +129,7 @@ class ClassicPrinter(APrinter):
     def _end(self):
         message = "success"
         prefix = "], "
-        if self.count == 0 and is_compatibility_mode():
+        if self.count == 0 and self._compatibility:
             # no array to end
             prefix = ""
 
@@ -161,7 +163,7 @@ class ClassicTreePrinter(ClassicPrinter):
             self._tree[group].append(row)
         else:
             self._tree[group] = [row]
-        if first and is_compatibility_mode():
+        if first and self._compatibility:
             return b'"epidata": ['
         return None
 
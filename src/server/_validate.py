@@ -7,14 +7,18 @@ from ._exceptions import UnAuthenticatedException, ValidationFailedException
 
 def resolve_auth_token() -> Optional[str]:
     # auth request param
-    if "auth" in request.values:
-        return request.values["auth"]
+    if "auth" in request.args:
+        return request.args["auth"]
+    if request.method != "GET" and "auth" in request.form:
+        return request.form["auth"]
+    auth_header = request.headers.get("Authorization")
+    if not auth_header:
+        return None
     # user name password
     if request.authorization and request.authorization.username == "epidata":
         return request.authorization.password
     # bearer token authentication
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
+    if auth_header.startswith("Bearer "):
         return auth_header[len("Bearer ") :]
     return None
 
@@ -102,7 +102,7 @@ def _handle_lag_issues_as_of(q: QueryBuilder, issues: Optional[List[Union[Tuple[
         q.subquery = f"JOIN (SELECT {sub_fields} FROM {q.table} WHERE {q.conditions_clause} AND {sub_condition_asof} GROUP BY {sub_group}) x ON {sub_condition}"
     else:
         # fetch most recent issue fast
-        q.conditions.append(f"({q.alias}.is_latest_issue IS TRUE)")
+        q.conditions.append(f"({q.alias}.is_latest_issue = 1)")
 
 
 def guess_index_to_use(time: List[TimePair], geo: List[GeoPair], issues: Optional[List[Union[Tuple[int, int], int]]] = None, lag: Optional[int] = None, as_of: Optional[int] = None) -> Optional[str]:
@@ -322,7 +322,7 @@ def handle_correlation():
     q.where_time_pairs("time_type", "time_value", [TimePair("day" if is_day else "week", [time_window])])
 
     # fetch most recent issue fast
-    q.conditions.append(f"({q.alias}.is_latest_issue IS TRUE)")
+    q.conditions.append(f"({q.alias}.is_latest_issue = 1)")
 
     df = as_pandas(str(q), q.params)
     if is_day:
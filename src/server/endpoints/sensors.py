@@ -9,7 +9,8 @@ from .._validate import (
 )
 from .._query import filter_strings, execute_query, filter_integers
 from .._exceptions import EpiDataException
-from typing import List
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Set
 
 # first argument is the endpoint name
 bp = Blueprint("sensors", __name__)
@@ -25,16 +26,31 @@ MAX_AUTH_KEYS_PROVIDED_PER_SENSOR_QUERY = 1
 PHP_INT_MAX = 2147483647
 
 
+def _index_granular_tokens() -> Mapping[str, FrozenSet[str]]:
+    """
+    builds the reverse lookup of granular auth token to the set of sensor names it grants access to
+    """
+    sensors_by_token: Dict[str, Set[str]] = {}
+    for name, tokens in GRANULAR_SENSOR_AUTH_TOKENS.items():
+        for token in tokens:
+            # an unset SECRET_SENSOR_* variable yields an empty token, which must not unlock anything
+            if token:
+                sensors_by_token.setdefault(token, set()).add(name)
+    return MappingProxyType({token: frozenset(names) for token, names in sensors_by_token.items()})
+
+
+#   Built once, so authenticating a query doesn't rescan the token lists of every sensor:
+_GRANULAR_SENSORS_BY_TOKEN = _index_granular_tokens()
+_MAX_VALID_GRANULAR_TOKENS_PER_NAME = max(len(v) for v in GRANULAR_SENSOR_AUTH_TOKENS.values())
+
+
 def _authenticate(names: List[str]):
     auth_tokens_presented = (resolve_auth_token() or "").split(",")
 
-    names = extract_strings("names")
     n_names = len(names)
     n_auth_tokens_presented = len(auth_tokens_presented)
 
-    max_valid_granular_tokens_per_name = max(
-        len(v) for v in GRANULAR_SENSOR_AUTH_TOKENS.values()
-    )
+    max_valid_granular_tokens_per_name = _MAX_VALID_GRANULAR_TOKENS_PER_NAME
 
     # The number of valid granular tokens is related to the number of auth token checks that a single query could perform.  Use the max number of valid granular auth tokens per name in the check below as a way to prevent leakage of sensor names (but revealing the number of sensor names) via this interface.  Treat all sensors as non-open for convenience of calculation.
     if n_names == 0:
@@ -72,16 +88,10 @@ def _authenticate(names: List[str]):
         sensor_authenticated_globally = AUTH["sensors"] in auth_tokens_presented
         # test whether they provided a "granular" auth token for one of the
         # sensor_subsets containing this sensor (if any):
-        sensor_authenticated_granularly = False
-        if name in GRANULAR_SENSOR_AUTH_TOKENS:
-            acceptable_granular_tokens_for_sensor = GRANULAR_SENSOR_AUTH_TOKENS[name]
-            # check for nonempty intersection between provided and acceptable
-            # granular auth tokens:
-            for acceptable_granular_token in acceptable_granular_tokens_for_sensor:
-                if acceptable_granular_token in auth_tokens_presented:
-                    sensor_authenticated_granularly = True
-                    break
-        # (else: there are no granular tokens for this sensor; can't authenticate granularly)
+        # (if there are no granular tokens for this sensor, it can't authenticate granularly)
+        sensor_authenticated_granularly = any(
+            name in _GRANULAR_SENSORS_BY_TOKEN.get(token, ()) for token in auth_tokens_presented
+        )
 
         if (
             not sensor_is_open
@@ -1,6 +1,7 @@
 """Unit tests for csv_importer.py."""
 
 # standard library
+from collections import namedtuple
 import unittest
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -20,6 +21,11 @@ from delphi.utils.epiweek import delta_epiweeks
 # py3tester coverage target
 __test_target__ = 'delphi.epidata.acquisition.covidcast.csv_importer'
 
+# a plain stand-in for the rows of `pandas.DataFrame.itertuples`
+Row = namedtuple('Row', [
+    'geo_id', 'value', 'stderr', 'sample_size',
+    'missing_value', 'missing_stderr', 'missing_sample_size'])
+
 
 class UnitTests(unittest.TestCase):
   """Basic unit tests."""
@@ -32,8 +38,11 @@ class UnitTests(unittest.TestCase):
     self.assertFalse(CsvImporter.is_sane_day(22222222))
     self.assertFalse(CsvImporter.is_sane_day(20200001))
     self.assertFalse(CsvImporter.is_sane_day(20200199))
+    self.assertFalse(CsvImporter.is_sane_day(20200231))
     self.assertFalse(CsvImporter.is_sane_day(202015))
 
+    self.assertEqual(CsvImporter.is_sane_day(20200418), date(2020, 4, 18))
+
   def test_is_sane_week(self):
     """Sanity check some weeks."""
 
@@ -118,6 +127,19 @@ class UnitTests(unittest.TestCase):
     ])
     self.assertEqual(found, expected)
 
+    # without an explicit issue, the issue is whatever day it is when scanning
+    class FixedDate(date):
+      @classmethod
+      def today(cls):
+        return cls(2020, 4, 20)
+
+    with patch('delphi.epidata.acquisition.covidcast.csv_importer.date', FixedDate):
+      found = dict(CsvImporter.find_csv_files(path_prefix, glob=mock_glob))
+
+    # (issue, lag) of the weekly and a daily file
+    self.assertEqual(found[glob_paths[0]][-2:], (202017, 2))
+    self.assertEqual(found[glob_paths[1]][-2:], (20200420, 12))
+
   def test_is_header_valid_allows_extra_columns(self):
     """Allow and ignore extra columns in the header."""
 
@@ -152,6 +174,10 @@ class UnitTests(unittest.TestCase):
     self.assertIsNone(CsvImporter.maybe_apply(int, 'NaN'))
     self.assertIsNone(CsvImporter.maybe_apply(float, ''))
     self.assertIsNone(CsvImporter.maybe_apply(float, None))
+    self.assertIsNone(CsvImporter.maybe_apply(float, np.nan))
+    self.assertEqual(CsvImporter.maybe_apply(float, np.float64(2.5)), 2.5)
+    with self.assertRaises(ValueError):
+      CsvImporter.maybe_apply(float, float('-inf'))
 
   def test_extract_and_check_row(self):
     """Apply various sanity checks to a row of data."""
@@ -165,16 +191,14 @@ class UnitTests(unittest.TestCase):
         missing_value=str(float(Nans.NOT_MISSING)),
         missing_stderr=str(float(Nans.NOT_MISSING)),
         missing_sample_size=str(float(Nans.NOT_MISSING))):
-      row = MagicMock(
+      row = Row(
           geo_id=geo_id,
           value=value,
           stderr=stderr,
           sample_size=sample_size,
           missing_value=missing_value,
           missing_stderr=missing_stderr,
-          missing_sample_size=missing_sample_size,
-          spec=["geo_id", "value", "stderr", "sample_size",
-                "missing_value", "missing_stderr", "missing_sample_size"])
+          missing_sample_size=missing_sample_size)
       return geo_type, row
 
     # cases to test each failure mode
@@ -223,6 +247,28 @@ class UnitTests(unittest.TestCase):
       self.assertEqual(values.stderr, field.stderr)
       self.assertEqual(values.sample_size, field.sample_size)
 
+  def test_normalize_geo_ids(self):
+    """Sanity check and normalize a whole column of geo_ids at once."""
+
+    def normalize(geo_type, geo_ids):
+      geo_ids = pandas.Series(geo_ids, dtype=object)
+      return list(CsvImporter.normalize_geo_ids(geo_ids, geo_type))
+
+    self.assertEqual(
+        normalize('county', ['01234', '1234', '00000', None]),
+        ['01234', None, None, None])
+    self.assertEqual(
+        normalize('state', ['CA', 'iowa', '48', np.nan]),
+        ['ca', None, None, None])
+    self.assertEqual(
+        normalize('hrr', ['1', '1.0', '600', '1.5', 'hrr001', None]),
+        ['1', '1', None, None, None, None])
+    self.assertEqual(
+        normalize('msa', ['10180', '01234', '10180.0', '1e4']),
+        ['10180', None, '10180', '10000'])
+    self.assertEqual(normalize('province', ['ab']), [None])
+    self.assertEqual(normalize('state', []), [])
+
   def test_load_csv_with_invalid_header(self):
     """Bail loading a CSV when the header is invalid."""
 
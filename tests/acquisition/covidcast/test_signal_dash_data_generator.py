@@ -132,7 +132,7 @@ class UnitTests(unittest.TestCase):
             (1, "Change", "chng", "chng-sig", date(2020, 1, 1), date(2020, 1, 2)),
             (2, "Quidel", "quidel", "quidel-sig", date(2020, 2, 1), date(2020, 2, 2)),
         ]
-        cursor.fetchall.return_value = db_rows
+        cursor.__iter__.return_value = iter(db_rows)
 
         signals = database.get_enabled_signals()
 
@@ -0,0 +1,68 @@
+"""Unit tests for granular sensor authentication in the sensors endpoint."""
+
+# standard library
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from delphi.epidata.server.main import app
+from delphi.epidata.server.endpoints import sensors
+from delphi.epidata.server.endpoints.sensors import _authenticate
+from delphi.epidata.server._exceptions import EpiDataException
+
+# py3tester coverage target
+__test_target__ = "delphi.epidata.server.endpoints.sensors"
+
+
+class UnitTests(unittest.TestCase):
+    """Basic unit tests."""
+
+    def setUp(self):
+        app.config["TESTING"] = True
+        app.config["WTF_CSRF_ENABLED"] = False
+        app.config["DEBUG"] = False
+
+    @contextmanager
+    def configured(self, granular_tokens, global_token="global-secret"):
+        # mimic _config, where unset SECRET_SENSOR_* variables yield ("",)
+        with patch.object(sensors, "GRANULAR_SENSOR_AUTH_TOKENS", granular_tokens), patch.dict(sensors.AUTH, {"sensors": global_token}):
+            with patch.object(sensors, "_GRANULAR_SENSORS_BY_TOKEN", sensors._index_granular_tokens()):
+                yield
+
+    def assertAuthenticated(self, names, auth=None):
+        with app.test_request_context("/" if auth is None else f"/?auth={auth}"):
+            _authenticate(names)
+
+    def assertNotAuthenticated(self, names, auth=None):
+        with app.test_request_context("/" if auth is None else f"/?auth={auth}"):
+            with self.assertRaises(EpiDataException):
+                _authenticate(names)
+
+    def test_open_sensors(self):
+        with self.configured({"twtr": ("twtr-secret",)}):
+            self.assertAuthenticated(["sar3"])
+            self.assertAuthenticated(["sar3", "epic", "arch"], auth="wrong")
+
+    def test_granular_tokens(self):
+        with self.configured({"twtr": ("twtr-secret", "shared-secret"), "gft": ("shared-secret",)}):
+            self.assertAuthenticated(["twtr"], auth="twtr-secret")
+            self.assertAuthenticated(["twtr", "gft"], auth="shared-secret")
+            self.assertAuthenticated(["twtr", "sar3"], auth="twtr-secret")
+            self.assertNotAuthenticated(["gft"], auth="twtr-secret")
+            self.assertNotAuthenticated(["twtr"])
+
+    def test_global_token(self):
+        with self.configured({"twtr": ("twtr-secret",)}):
+            self.assertAuthenticated(["twtr", "gft", "wiki"], auth="global-secret")
+
+    def test_wrong_token(self):
+        with self.configured({"twtr": ("twtr-secret",)}):
+            self.assertNotAuthenticated(["twtr"], auth="wrong")
+            self.assertNotAuthenticated(["nonexistent"], auth="twtr-secret")
+
+    def test_unset_tokens(self):
+        with self.configured({"twtr": ("twtr-secret",), "wiki": ("",), "ght": ("",)}, global_token=None):
+            # an unconfigured sensor must not be unlocked by presenting no token
+            self.assertNotAuthenticated(["wiki"])
+            self.assertNotAuthenticated(["ght"], auth="")
+            self.assertAuthenticated(["twtr"], auth="twtr-secret")
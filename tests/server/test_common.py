@@ -0,0 +1,72 @@
+"""Unit tests for the request hooks in _common.py."""
+
+# standard library
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+from delphi.epidata.server import _common
+from delphi.epidata.server._common import connect_db, _db_skip_prefixes
+from delphi.epidata.server._exceptions import DatabaseErrorException
+
+# the main app, with all endpoints registered
+from delphi.epidata.server.main import app
+
+# py3tester coverage target
+__test_target__ = "delphi.epidata.server._common"
+
+
+class UnitTests(unittest.TestCase):
+    """Basic unit tests."""
+
+    def setUp(self):
+        app.config["TESTING"] = True
+        app.config["WTF_CSRF_ENABLED"] = False
+        app.config["DEBUG"] = False
+
+    def test_connect_db_skips_static_paths(self):
+        for url_prefix in ("/", "/epidata"):
+            base = url_prefix.rstrip("/")
+            with patch.object(_common, "_DB_SKIP_PREFIXES", _db_skip_prefixes(url_prefix)), patch.object(_common, "_get_db") as get_db:
+                for path in ("/lib/jquery.js", "/version", "/index.html"):
+                    with self.subTest(url_prefix=url_prefix, path=path):
+                        with app.test_request_context(base + path):
+                            connect_db()
+                        get_db.assert_not_called()
+
+                with self.subTest(url_prefix=url_prefix, path="/fluview/"):
+                    with app.test_request_context(base + "/fluview/"):
+                        connect_db()
+                    get_db.assert_called_once()
+
+    def test_connect_db_throttles_tracebacks(self):
+        error = OperationalError("SELECT 1", {}, Exception("connection refused"))
+        with patch.object(_common, "_last_db_error_traceback", float("-inf")), patch.object(_common, "_get_db", side_effect=error), patch.object(app.logger, "error") as log_error:
+            for _ in range(2):
+                with app.test_request_context("/fluview/"):
+                    with self.assertRaises(DatabaseErrorException):
+                        connect_db()
+
+            self.assertEqual(log_error.call_count, 2)
+            # only the first failure within the interval carries the traceback
+            self.assertTrue(log_error.call_args_list[0][1]["exc_info"])
+            self.assertFalse(log_error.call_args_list[1][1]["exc_info"])
+            # but both still log the error itself
+            for call in log_error.call_args_list:
+                self.assertIs(call[0][1], error)
+
+    def test_connect_db_propagates_other_errors(self):
+        with patch.object(_common, "_get_db", side_effect=RuntimeError("boom")), patch.object(app.logger, "error") as log_error:
+            with app.test_request_context("/fluview/"):
+                with self.assertRaises(RuntimeError):
+                    connect_db()
+            log_error.assert_not_called()
+
+    def test_connect_db_skips_preflight_requests(self):
+        with patch.object(_common, "engine") as engine:
+            engine.connect.side_effect = AssertionError("preflight requests must not connect to the database")
+            response = app.test_client().options("/fluview/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("OPTIONS", response.headers["Allow"])
+        engine.connect.assert_not_called()
@@ -45,6 +45,18 @@ class UnitTests(unittest.TestCase):
             with app.test_request_context("/?auth=abc"):
                 self.assertEqual(resolve_auth_token(), "abc")
 
+        with self.subTest("form param"):
+            with app.test_request_context("/", method="POST", data={"auth": "abc"}):
+                self.assertEqual(resolve_auth_token(), "abc")
+
+        with self.subTest("param before header"):
+            with app.test_request_context("/?auth=abc", headers={"Authorization": "Bearer def"}):
+                self.assertEqual(resolve_auth_token(), "abc")
+
+        with self.subTest("form param before header"):
+            with app.test_request_context("/", method="POST", data={"auth": "abc"}, headers={"Authorization": "Bearer def"}):
+                self.assertEqual(resolve_auth_token(), "abc")
+
         with self.subTest("bearer token"):
             with app.test_request_context("/", headers={"Authorization": "Bearer abc"}):
                 self.assertEqual(resolve_auth_token(), "abc")